@@ -18,6 +18,8 @@
 #
 # You should have received a copy of the GNU General Public License
 
+import copy
+import functools
 import logging
 import math
 import numpy as np
@@ -37,6 +39,13 @@ __all__ = ["ObservatoryModel"]
 TWOPI = 2 * np.pi
 
 
+@functools.lru_cache(maxsize=None)
+def _read_module_conf():
+    """Read and cache the configuration file stored with the module."""
+    conf_file = os.path.join(os.path.dirname(__file__), "observatory_model.conf")
+    return read_conf_file(conf_file)
+
+
 class ObservatoryModel(object):
     """Class for modeling the observatory."""
 
@@ -101,14 +110,15 @@ class ObservatoryModel(object):
     def get_configure_dict(cls):
         """Get the configuration dictionary for the observatory model.
 
+        The module configuration file is only parsed once; each call returns
+        a fresh copy that the caller is free to modify.
+
         Returns
         -------
         `dict`
             The configuration dictionary for the observatory model.
         """
-        conf_file = os.path.join(os.path.dirname(__file__), "observatory_model.conf")
-        conf_dict = read_conf_file(conf_file)
-        return conf_dict
+        return copy.deepcopy(_read_module_conf())
 
     def altaz2radecpa(self, dateprofile, alt_rad, az_rad):
         """Converts alt, az coordinates into ra, dec for the given time.
@@ -176,17 +186,19 @@ class ObservatoryModel(object):
             peak velocity in radians/sec
         """
         d = abs(distance)
-        vpeak_free_range = (2 * free_range / (1 / accel + 1 / decel)) ** 0.5
+        # Time spent per unit of speed gained and then lost again.
+        ramp_time = 1.0 / accel + 1.0 / decel
+        vpeak_free_range = math.sqrt(2 * free_range / ramp_time)
         if vpeak_free_range > maxspeed:
             vpeak_free_range = maxspeed
 
         if free_range > d:
             return 0.0, vpeak_free_range
 
-        vpeak = (2 * d / (1 / accel + 1 / decel)) ** 0.5
+        vpeak = math.sqrt(2 * d / ramp_time)
 
         if vpeak <= maxspeed:
-            delay = (vpeak - vpeak_free_range) * (1.0 / accel + 1.0 / decel)
+            delay = (vpeak - vpeak_free_range) * ramp_time
         else:
             d1 = 0.5 * (maxspeed * maxspeed) / accel - free_range * accel / (
                 accel + decel
@@ -406,8 +418,10 @@ class ObservatoryModel(object):
         self.configure_slew(confdict)
         self.configure_park(confdict)
 
-        self.current_state.mountedfilters = self.params.filter_init_mounted_list
-        self.current_state.unmountedfilters = self.params.filter_init_unmounted_list
+        self.current_state.mountedfilters = tuple(self.params.filter_init_mounted_list)
+        self.current_state.unmountedfilters = tuple(
+            self.params.filter_init_unmounted_list
+        )
         self.park_state.mountedfilters = self.current_state.mountedfilters
         self.park_state.unmountedfilters = self.current_state.unmountedfilters
 
@@ -537,10 +551,9 @@ class ObservatoryModel(object):
             The configuration file to use.
         """
         if conf_file is None:
-            conf_file = os.path.join(
-                os.path.dirname(__file__), "observatory_model.conf"
-            )
-        conf_dict = read_conf_file(conf_file)
+            conf_dict = self.get_configure_dict()
+        else:
+            conf_dict = read_conf_file(conf_file)
         self.configure(conf_dict)
 
     def configure_optics(self, confdict):
@@ -805,6 +818,76 @@ class ObservatoryModel(object):
 
         return (final_abs_rad, distance_rad)
 
+    def _get_closest_angle_distance_batch(
+        self, target_rad, current_abs_rad, min_abs_rad=None, max_abs_rad=None
+    ):
+        """Calculate the closest angular distances including handling \
+           cable wrap if necessary.
+
+        This is the array version of `get_closest_angle_distance` and must
+        give exactly the same results for every element.
+
+        Parameters
+        ----------
+        target_rad : `np.ndarray`
+            The destination angles (radians).
+        current_abs_rad : `np.ndarray` or `float`
+            The current angles (radians).
+        min_abs_rad : `float`, optional
+            The minimum constraint angle (radians).
+        max_abs_rad : `float`, optional
+            The maximum constraint angle (radians).
+
+        Returns
+        -------
+        final_abs_rad : `np.ndarray`
+            accumulated angles in radians
+        distance_rad : `np.ndarray`
+            distance angles in radians
+        """
+        target_rad = np.asarray(target_rad, dtype=float)
+        current_abs_rad = np.asarray(current_abs_rad, dtype=float)
+
+        # if there are wrap limits, normalizes the target angles
+        if min_abs_rad is not None:
+            norm_target_rad = np.mod(target_rad - min_abs_rad, TWOPI) + min_abs_rad
+            if max_abs_rad is not None:
+                # if the target angle is unreachable
+                # then sets an arbitrary value
+                norm_target_rad = np.where(
+                    norm_target_rad > max_abs_rad,
+                    np.maximum(min_abs_rad, norm_target_rad - np.pi),
+                    norm_target_rad,
+                )
+        else:
+            norm_target_rad = target_rad
+
+        # computes the distance clockwise
+        distance_rad = np.mod(norm_target_rad - current_abs_rad, TWOPI)
+
+        # take the counter-clockwise distance if shorter
+        distance_rad = np.where(
+            distance_rad > np.pi, distance_rad - TWOPI, distance_rad
+        )
+
+        # if there are wrap limits
+        if (min_abs_rad is not None) and (max_abs_rad is not None):
+            # compute accumulated angle
+            accum_abs_rad = current_abs_rad + distance_rad
+
+            # if limits reached chose the other direction
+            distance_rad = np.where(
+                accum_abs_rad > max_abs_rad, distance_rad - TWOPI, distance_rad
+            )
+            distance_rad = np.where(
+                accum_abs_rad < min_abs_rad, distance_rad + TWOPI, distance_rad
+            )
+
+        # compute final accumulated angle
+        final_abs_rad = current_abs_rad + distance_rad
+
+        return (final_abs_rad, distance_rad)
+
     def get_closest_state(self, targetposition, istracking=False):
         """Find the closest observatory state for the given target position.
 
@@ -1762,6 +1845,60 @@ class ObservatoryModel(object):
 
         self.slew_to_position(targetposition)
 
+    def slew_radec_batch(self, time, ra_rad, dec_rad, ang_rad, band_filter):
+        """Slew observatory through a sequence of ra, dec locations.
+
+        Each slew starts from the state left by the previous one, so the
+        slews are performed in order and a copy of the observatory state
+        after each one is collected.
+
+        Parameters
+        ----------
+        time : `float`
+            The UTC timestamp of the request, used for every slew. Since the
+            model never moves back in time, each slew after the first starts
+            when the previous one ended.
+        ra_rad : `np.ndarray`
+            The right ascensions (radians) to slew to.
+        dec_rad : `np.ndarray`
+            The declinations (radians) to slew to.
+        ang_rad : `np.ndarray`
+            The sky angles (radians) for the slews.
+        band_filter : `str` or `list` of `str`
+            The band filter for the slews. A single `str` is used for all of
+            them; a `list` gives the filter for each slew and must have one
+            entry per position.
+
+        Returns
+        -------
+        states : `list` of :class:`.ObservatoryState`
+            The observatory state after each slew.
+
+        Raises
+        ------
+        ValueError
+            If ``band_filter`` is a `list` whose length does not match the
+            number of positions.
+        """
+        ra_rad, dec_rad, ang_rad = np.broadcast_arrays(
+            *np.atleast_1d(ra_rad, dec_rad, ang_rad)
+        )
+        if isinstance(band_filter, str):
+            band_filter = [band_filter] * ra_rad.size
+        elif len(band_filter) != ra_rad.size:
+            raise ValueError(
+                f"Got {len(band_filter)} band filters for {ra_rad.size} positions."
+            )
+
+        states = []
+        for ra, dec, ang, band in zip(ra_rad, dec_rad, ang_rad, band_filter):
+            self.slew_radec(time, ra, dec, ang, band)
+            state = ObservatoryState()
+            state.set(self.current_state)
+            states.append(state)
+
+        return states
+
     def slew_to_position(self, targetposition):
         """Slew the observatory to a given position.
 
@@ -1819,10 +1956,13 @@ class ObservatoryModel(object):
             The band filter name to unmount.
         """
         if filter_to_unmount in self.current_state.mountedfilters:
-            self.current_state.mountedfilters.remove(filter_to_unmount)
-            filter_to_mount = self.current_state.unmountedfilters.pop()
-            self.current_state.mountedfilters.append(filter_to_mount)
-            self.current_state.unmountedfilters.append(filter_to_unmount)
+            mounted = self.current_state.mountedfilters
+            unmounted = self.current_state.unmountedfilters
+            filter_to_mount = unmounted[-1]
+            self.current_state.mountedfilters = tuple(
+                f for f in mounted if f != filter_to_unmount
+            ) + (filter_to_mount,)
+            self.current_state.unmountedfilters = unmounted[:-1] + (filter_to_unmount,)
 
             self.park_state.mountedfilters = self.current_state.mountedfilters
             self.park_state.unmountedfilters = self.current_state.unmountedfilters
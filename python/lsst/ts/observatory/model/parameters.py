@@ -197,9 +197,12 @@ class ObservatoryModelParameters(object):
         activities : `list` of `str`
             The set of slew activities
         """
+        # Prerequisites are stored as tuples: they are only iterated, and
+        # their order decides which prerequisite wins a tie in the critical
+        # path.
         for activity in activities:
             key = "prereq_" + activity
-            self.prerequisites[activity] = list(confdict["slew"][key])
+            self.prerequisites[activity] = tuple(confdict["slew"][key])
 
     def configure_telescope(self, confdict):
         """Configure the telescope related parameters.
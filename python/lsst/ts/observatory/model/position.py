@@ -79,20 +79,10 @@ class ObservatoryPosition(object):
     def __str__(self):
         """str: The string representation of the instance."""
         return (
-            "t=%.1f ra=%.3f dec=%.3f ang=%.3f filter=%s track=%s alt=%.3f "
-            "az=%.3f pa=%.3f rot=%.3f"
-            % (
-                self.time,
-                self.ra,
-                self.dec,
-                self.ang,
-                self.filter,
-                self.tracking,
-                self.alt,
-                self.az,
-                self.pa,
-                self.rot,
-            )
+            f"t={self.time:.1f} ra={self.ra:.3f} dec={self.dec:.3f} "
+            f"ang={self.ang:.3f} filter={self.filter} track={self.tracking} "
+            f"alt={self.alt:.3f} az={self.az:.3f} pa={self.pa:.3f} "
+            f"rot={self.rot:.3f}"
         )
 
     @property
@@ -45,8 +45,8 @@ class ObservatoryState(ObservatoryPosition):
         telrot_rad=0.0,
         domalt_rad=1.5,
         domaz_rad=0.0,
-        mountedfilters=["g", "r", "i", "z", "y"],
-        unmountedfilters=["u"],
+        mountedfilters=("g", "r", "i", "z", "y"),
+        unmountedfilters=("u",),
     ):
         """Initialize the class.
 
@@ -83,10 +83,12 @@ class ObservatoryState(ObservatoryPosition):
             The altitude (radians) of the dome opening for the given state.
         domaz_rad : `float`
             The azimuth (radians) of the dome opening for the given state.
-        mountedfilters : `list` of `str`
-            The list of band filters currently mounted for the given state.
-        unmountedfilters : `list` of `str`
-            The list of band filters currently unmounted for the given state.
+        mountedfilters : iterable of `str`
+            The band filters currently mounted for the given state. Stored
+            as a `tuple`.
+        unmountedfilters : iterable of `str`
+            The band filters currently unmounted for the given state. Stored
+            as a `tuple`.
         fail_record : `dict`
             A dictionary of string keys that represent reason of failure, and
             and integer to record the count of that failure.
@@ -123,8 +125,8 @@ class ObservatoryState(ObservatoryPosition):
         self.domalt_peakspeed_rad = 0
         self.domaz_rad = domaz_rad
         self.domaz_peakspeed_rad = 0
-        self.mountedfilters = list(mountedfilters)
-        self.unmountedfilters = list(unmountedfilters)
+        self.mountedfilters = tuple(mountedfilters)
+        self.unmountedfilters = tuple(unmountedfilters)
         self.fail_record = {}
         self.fail_state = 0
         self.fail_value_table = {
@@ -139,12 +141,11 @@ class ObservatoryState(ObservatoryPosition):
 
     def __str__(self):
         """str: The string representation of the instance."""
-        return "%s telaz=%.3f telrot=%.3f mounted=%s unmounted=%s" % (
-            ObservatoryPosition.__str__(self),
-            self.telaz,
-            self.telrot,
-            self.mountedfilters,
-            self.unmountedfilters,
+        return (
+            f"{ObservatoryPosition.__str__(self)} "
+            f"telaz={self.telaz:.3f} telrot={self.telrot:.3f} "
+            f"mounted={list(self.mountedfilters)} "
+            f"unmounted={list(self.unmountedfilters)}"
         )
 
     @property
@@ -231,8 +232,9 @@ class ObservatoryState(ObservatoryPosition):
         self.domalt_peakspeed_rad = newstate.domalt_peakspeed_rad
         self.domaz_rad = newstate.domaz_rad
         self.domaz_peakspeed_rad = newstate.domaz_peakspeed_rad
-        self.mountedfilters = list(newstate.mountedfilters)
-        self.unmountedfilters = list(newstate.unmountedfilters)
+        # The filter tuples are immutable, so they can be shared.
+        self.mountedfilters = newstate.mountedfilters
+        self.unmountedfilters = newstate.unmountedfilters
 
     def set_position(self, newposition):
         """Override the current position information with new values.
@@ -281,8 +283,20 @@ class ObservatoryState(ObservatoryPosition):
             The name of the band filter to mount.
         filter_to_unmount : `str`
             The name of the band filter to unmount.
+
+        Raises
+        ------
+        ValueError
+            If ``filter_to_unmount`` is not mounted or ``filter_to_mount`` is
+            not unmounted.
         """
-        self.mountedfilters.remove(filter_to_unmount)
-        self.unmountedfilters.remove(filter_to_mount)
-        self.mountedfilters.append(filter_to_mount)
-        self.unmountedfilters.append(filter_to_unmount)
+        if filter_to_unmount not in self.mountedfilters:
+            raise ValueError(f"Filter {filter_to_unmount!r} is not mounted.")
+        if filter_to_mount not in self.unmountedfilters:
+            raise ValueError(f"Filter {filter_to_mount!r} is not unmounted.")
+        self.mountedfilters = tuple(
+            f for f in self.mountedfilters if f != filter_to_unmount
+        ) + (filter_to_mount,)
+        self.unmountedfilters = tuple(
+            f for f in self.unmountedfilters if f != filter_to_mount
+        ) + (filter_to_unmount,)
@@ -24,6 +24,18 @@ import json
 
 __all__ = ["Target"]
 
+# Attributes a JSON blob must provide to rebuild a Target.
+JSON_MANDATORY_FIELDS = (
+    "targetid",
+    "fieldid",
+    "filter",
+    "ra_rad",
+    "dec_rad",
+    "ang_rad",
+    "num_exp",
+    "exp_times",
+)
+
 
 class Target(object):
     """Class for gathering information for a sky target."""
@@ -462,20 +474,9 @@ class Target(object):
         alternate __init__ method that takes a json representation as the only
         argument.
         """
-        mandatory_fields = [
-            "targetid",
-            "fieldid",
-            "filter",
-            "ra_rad",
-            "dec_rad",
-            "ang_rad",
-            "num_exp",
-            "exp_times",
-        ]
-
         jsondict = json.loads(jsonstr)
-        for f in mandatory_fields:
-            if f not in jsondict.keys():
+        for f in JSON_MANDATORY_FIELDS:
+            if f not in jsondict:
                 raise KeyError(
                     "json blob passed to Target()'s json constructor is missing required attribute: "
                     + f
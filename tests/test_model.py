@@ -18,6 +18,8 @@
 #
 # You should have received a copy of the GNU General Public License
 
+import copy
+import itertools
 import math
 import numpy as np
 import unittest
@@ -26,6 +28,177 @@ from lsst.ts.dateloc import ObservatoryLocation
 from lsst.ts.observatory.model import ObservatoryModel, Target
 
 
+def make_target(ra, dec, ang, band_filter):
+    """Make a slew target from sky coordinates in degrees."""
+    return Target(
+        band_filter=band_filter,
+        ra_rad=math.radians(ra),
+        dec_rad=math.radians(dec),
+        ang_rad=math.radians(ang),
+    )
+
+
+def closest_angle_oracle(angle, current, min_abs, max_abs):
+    """Reference closest angle move, in integer degrees, for a cable wrap
+    range that spans at least one full turn.
+    """
+    distance = (angle - current) % 360
+    if distance > 180:
+        distance -= 360
+    if current + distance > max_abs:
+        distance -= 360
+    elif current + distance < min_abs:
+        distance += 360
+    return (current + distance, distance)
+
+
+# The park state, and the state after update_state(0) from it, in degrees.
+PARK_STATE = dict(
+    time=0.0,
+    ra=0.0,
+    dec=0.0,
+    ang=0.0,
+    band_filter="r",
+    tracking=False,
+    alt=86.5,
+    az=0.0,
+    pa=0.0,
+    rot=0.0,
+    telaz=0.0,
+    telrot=0.0,
+)
+INITIAL_STATE = dict(PARK_STATE, ra=29.480, dec=-26.744, ang=180.0, pa=180.0)
+
+# Rows of the CLOSEST_ANGLE tables are
+# (angle, current, expected final angle, expected distance) in degrees.
+CLOSEST_ANGLE_UNLIMITED = (
+    (0, 0, 0, 0),
+    (90, 0, 90, 90),
+    (180, 0, 180, 180),
+    (360, 0, 0, 0),
+    (-90, 0, -90, -90),
+    (-180, 0, 180, 180),
+    (-360, 0, 0, 0),
+)
+
+CLOSEST_ANGLE_CABLE_WRAP270 = (
+    (0, 0, 0, 0),
+    (90, 0, 90, 90),
+    (180, 0, 180, 180),
+    (360, 0, 0, 0),
+    (-90, 0, -90, -90),
+    (-180, 0, 180, 180),
+    (-360, 0, 0, 0),
+    (0, 180, 0, -180),
+    (90, 180, 90, -90),
+    (180, 180, 180, 0),
+    (360, 180, 0, -180),
+    (-90, 180, 270, 90),
+    (-180, 180, 180, 0),
+    (-360, 180, 0, -180),
+    (0, -180, 0, 180),
+    (90, -180, -270, -90),
+    (180, -180, -180, 0),
+    (360, -180, 0, 180),
+    (-90, -180, -90, 90),
+    (-180, -180, -180, 0),
+    (-360, -180, 0, 180),
+)
+
+CLOSEST_ANGLE_CABLE_WRAP90 = (
+    (0, 0, 0, 0),
+    (45, 0, 45, 45),
+    (90, 0, 90, 90),
+    (180, 0, 0, 0),
+    (270, 0, -90, -90),
+    (360, 0, 0, 0),
+    (-45, 0, -45, -45),
+    (-90, 0, -90, -90),
+    (-180, 0, 0, 0),
+    (-270, 0, 90, 90),
+    (-360, 0, 0, 0),
+)
+
+# Position of each slew activity in the expected delay tuples.
+SLEW_ACTIVITY_INDEX = {
+    activity: i
+    for i, activity in enumerate(
+        (
+            "telalt",
+            "telaz",
+            "telrot",
+            "telopticsopenloop",
+            "telopticsclosedloop",
+            "domalt",
+            "domaz",
+            "domazsettle",
+            "filter",
+            "readout",
+        )
+    )
+}
+
+# Consecutive slews with rotator_followsky, starting from the initial state:
+# the target (ra, dec, ang, filter), the resulting state, the activity delays,
+# the critical path and the telescope/dome peak speeds.
+SLEW_SEQUENCE = (
+    (
+        (60, -20, 0, "r"),
+        dict(
+            time=74.2,
+            ra=60.000,
+            dec=-20.000,
+            ang=180.000,
+            alt=60.904,
+            az=76.495,
+            pa=243.368,
+            rot=63.368,
+            telaz=76.495,
+            telrot=63.368,
+        ),
+        (8.387, 11.966, 21.641, 7.387, 20.0, 18.775, 53.174, 1.0, 0.0, 2.0),
+        ["telopticsclosedloop", "domazsettle", "domaz"],
+        (-3.50, 7.00, 3.50, -1.75, 1.50),
+    ),
+    (
+        (60, -20, 0, "i"),
+        dict(
+            time=194.2,
+            ra=60.000,
+            dec=-20.000,
+            ang=180.000,
+            alt=61.324,
+            az=76.056,
+            pa=243.156,
+            rot=63.156,
+            telaz=76.056,
+            telrot=63.156,
+        ),
+        (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 120.0, 2.0),
+        ["filter"],
+        (0, 0, 0, 0, 0),
+    ),
+    (
+        (61, -21, 1, "i"),
+        dict(
+            time=199.0,
+            ra=61.000,
+            dec=-21.000,
+            ang=181.000,
+            alt=60.931,
+            az=78.751,
+            pa=245.172,
+            rot=64.172,
+            telaz=78.751,
+            telrot=64.172,
+        ),
+        (0.683, 1.244, 2.022, 0.117, 0.0, 1.365, 3.801, 1.0, 0.000, 2.000),
+        ["domazsettle", "domaz"],
+        (-1.194, 4.354, 1.011, -0.598, 1.425),
+    ),
+)
+
+
 class ObservatoryModelTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -35,54 +208,80 @@ class ObservatoryModelTest(unittest.TestCase):
         cls.model = ObservatoryModel(cls.location)
         cls.model.configure_from_module()
 
+        # Configuring is the expensive part, so do it once and restore these
+        # snapshots before each test instead.
+        cls.pristine_params = copy.deepcopy(cls.model.params)
+        cls.pristine_park_state = copy.deepcopy(cls.model.park_state)
+
+        # Fixed pointings for the approximate slew time checks.
+        cls.out_of_bounds_alt = np.radians([90.0, 0.0, -20.0])
+        cls.out_of_bounds_az = np.zeros(3)
+        cls.sweep_alt = np.radians(np.arange(0.0, 90.0, 1.0))
+        cls.sweep_az = np.radians(np.arange(0.0, 180.0, 2.0))
+
     def setUp(self):
+        vars(self.model.params).update(copy.deepcopy(vars(self.pristine_params)))
+        self.model.park_state.set(self.pristine_park_state)
         self.model.park_state.filter = "r"
         self.model.reset()
 
     def check_delay_and_state(self, model, delays, critical_path, state):
-        lastslew_delays_dict = model.lastslew_delays_dict
-        for key in lastslew_delays_dict:
-            # This activity was not recorded in truth arrays.
-            if key == "telsettle":
-                continue
-            self.assertAlmostEqual(lastslew_delays_dict[key], delays[key], delta=1e-3)
+        # The telsettle activity was not recorded in truth arrays.
+        keys = sorted(set(model.lastslew_delays_dict) - {"telsettle"})
+        np.testing.assert_allclose(
+            [model.lastslew_delays_dict[key] for key in keys],
+            [delays[SLEW_ACTIVITY_INDEX[key]] for key in keys],
+            atol=1e-3,
+        )
 
         self.assertListEqual(model.lastslew_criticalpath, critical_path)
 
-        self.assertAlmostEqual(
-            model.current_state.telalt_peakspeed, state[0], delta=1e-3
-        )
-        self.assertAlmostEqual(
-            model.current_state.telaz_peakspeed, state[1], delta=1e-3
-        )
-        self.assertAlmostEqual(
-            model.current_state.telrot_peakspeed, state[2], delta=1e-3
-        )
-        self.assertAlmostEqual(
-            model.current_state.domalt_peakspeed, state[3], delta=1e-3
-        )
-        self.assertAlmostEqual(
-            model.current_state.domaz_peakspeed, state[4], delta=1e-3
-        )
-
-    def make_slewact_dict(self, delays):
-        slewacts = (
-            "telalt",
-            "telaz",
-            "telrot",
-            "telopticsopenloop",
-            "telopticsclosedloop",
-            "domalt",
-            "domaz",
-            "domazsettle",
-            "filter",
-            "readout",
-        )
-        delay_map = {}
-        for i, slew in enumerate(slewacts):
-            if delays[i] > 0.0:
-                delay_map[slew] = delays[i]
-        return delay_map
+        current_state = model.current_state
+        np.testing.assert_allclose(
+            [
+                current_state.telalt_peakspeed,
+                current_state.telaz_peakspeed,
+                current_state.telrot_peakspeed,
+                current_state.domalt_peakspeed,
+                current_state.domaz_peakspeed,
+            ],
+            state,
+            atol=1e-3,
+        )
+
+    def check_state(
+        self,
+        state,
+        time,
+        band_filter,
+        tracking,
+        mounted=("g", "r", "i", "z", "y"),
+        unmounted=("u",),
+        **angles,
+    ):
+        """Check the fields of an observatory state.
+
+        The angles (ra, dec, ang, alt, az, pa, rot, telaz, telrot) are given
+        as keyword arguments in degrees. Values are compared after rounding
+        to the precision of `ObservatoryState.__str__`: 0.1 s for the time
+        and 0.001 deg for the angles.
+        """
+        self.assertEqual(f"{state.time:.1f}", f"{time:.1f}")
+        self.assertEqual(state.filter, band_filter)
+        self.assertEqual(state.tracking, tracking)
+        for name, value in angles.items():
+            self.assertEqual(f"{getattr(state, name):.3f}", f"{value:.3f}", msg=name)
+        self.assertTupleEqual(state.mountedfilters, tuple(mounted))
+        self.assertTupleEqual(state.unmountedfilters, tuple(unmounted))
+
+    def preset_old_values(self, **params):
+        """Use old values, to avoid updating final states.
+
+        Any extra keyword arguments are set as model parameters as well.
+        """
+        params = dict(domaz_free_range=0, optics_cl_delay=[0, 20.0], **params)
+        for name, value in params.items():
+            setattr(self.model.params, name, value)
 
     def test_init(self):
         temp_model = ObservatoryModel(self.location)
@@ -98,407 +297,141 @@ class ObservatoryModelTest(unittest.TestCase):
         self.assertEqual(temp_model.location.longitude, -70.7494)
         self.assertEqual(temp_model.current_state.telalt_rad, math.radians(86.5))
 
-    def test_get_closest_angle_distance_unlimited(self):
-        self.assertEqual(
-            self.model.get_closest_angle_distance(math.radians(0), math.radians(0)),
-            (math.radians(0), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(math.radians(90), math.radians(0)),
-            (math.radians(90), math.radians(90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(math.radians(180), math.radians(0)),
-            (math.radians(180), math.radians(180)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(math.radians(360), math.radians(0)),
-            (math.radians(0), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(math.radians(-90), math.radians(0)),
-            (math.radians(-90), math.radians(-90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(math.radians(-180), math.radians(0)),
-            (math.radians(180), math.radians(180)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(math.radians(-360), math.radians(0)),
-            (math.radians(0), math.radians(0)),
-        )
-
-    def test_get_closest_angle_distance_cable_wrap270(self):
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(0), math.radians(0), math.radians(-270), math.radians(270)
-            ),
-            (math.radians(0), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(90), math.radians(0), math.radians(-270), math.radians(270)
-            ),
-            (math.radians(90), math.radians(90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(180),
-                math.radians(0),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(180), math.radians(180)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(360),
-                math.radians(0),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(0), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-90),
-                math.radians(0),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(-90), math.radians(-90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-180),
-                math.radians(0),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(180), math.radians(180)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-360),
-                math.radians(0),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(0), math.radians(0)),
-        )
-
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(0),
-                math.radians(180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(0), math.radians(-180)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(90),
-                math.radians(180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(90), math.radians(-90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(180),
-                math.radians(180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(180), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(360),
-                math.radians(180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(0), math.radians(-180)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-90),
-                math.radians(180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(270), math.radians(90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-180),
-                math.radians(180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(180), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-360),
-                math.radians(180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(0), math.radians(-180)),
-        )
-
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(0),
-                math.radians(-180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(0), math.radians(180)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(90),
-                math.radians(-180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(-270), math.radians(-90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(180),
-                math.radians(-180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(-180), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(360),
-                math.radians(-180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(0), math.radians(180)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-90),
-                math.radians(-180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(-90), math.radians(90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-180),
-                math.radians(-180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(-180), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-360),
-                math.radians(-180),
-                math.radians(-270),
-                math.radians(270),
-            ),
-            (math.radians(0), math.radians(180)),
-        )
-
-    def test_get_closest_angle_distance_cable_wrap90(self):
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(0), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(0), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(45), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(45), math.radians(45)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(90), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(90), math.radians(90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(180), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(0), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(270), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(-90), math.radians(-90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(360), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(0), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-45), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(-45), math.radians(-45)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-90), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(-90), math.radians(-90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-180), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(0), math.radians(0)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-270), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(90), math.radians(90)),
-        )
-        self.assertEqual(
-            self.model.get_closest_angle_distance(
-                math.radians(-360), math.radians(0), math.radians(-90), math.radians(90)
-            ),
-            (math.radians(0), math.radians(0)),
-        )
-
     def test_reset(self):
         self.model.reset()
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=0.000 dec=0.000 ang=0.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=0.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
+        self.check_state(self.model.current_state, **PARK_STATE)
+
+    def test_update_state_from_park(self):
+        # Other tests start from this state without checking it again.
+        self.model.update_state(0)
+        self.check_state(self.model.current_state, **INITIAL_STATE)
 
     def test_slew_altaz(self):
         self.model.update_state(0)
-        # Use old values, to avoid updating final states.
-        self.model.params.domaz_free_range = 0
-        self.model.params.optics_cl_delay = [0, 20.0]
+        self.preset_old_values()
 
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
         self.model.slew_altaz(
             0, math.radians(80), math.radians(0), math.radians(0), "r"
         )
         self.model.start_tracking(0)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=7.7 ra=29.510 dec=-20.244 ang=180.000 "
-            "filter=r track=True alt=80.000 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
+        self.check_state(
+            self.model.current_state,
+            time=7.7,
+            ra=29.510,
+            dec=-20.244,
+            ang=180.000,
+            band_filter="r",
+            tracking=True,
+            alt=80.000,
+            az=0.000,
+            pa=180.000,
+            rot=0.000,
+            telaz=0.000,
+            telrot=0.000,
         )
 
         self.model.update_state(100)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=100.0 ra=29.510 dec=-20.244 ang=180.000 "
-            "filter=r track=True alt=79.994 az=357.901 pa=178.068 rot=358.068 "
-            "telaz=-2.099 telrot=-1.932 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
+        self.check_state(
+            self.model.current_state,
+            time=100.0,
+            ra=29.510,
+            dec=-20.244,
+            ang=180.000,
+            band_filter="r",
+            tracking=True,
+            alt=79.994,
+            az=357.901,
+            pa=178.068,
+            rot=358.068,
+            telaz=-2.099,
+            telrot=-1.932,
         )
         self.model.slew_altaz(
             100, math.radians(70), math.radians(30), math.radians(15), "r"
         )
         self.model.start_tracking(0)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=144.4 ra=40.172 dec=-12.558 ang=191.265 "
-            "filter=r track=True alt=70.000 az=30.000 pa=206.265 rot=15.000 "
-            "telaz=30.000 telrot=15.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
+        self.check_state(
+            self.model.current_state,
+            time=144.4,
+            ra=40.172,
+            dec=-12.558,
+            ang=191.265,
+            band_filter="r",
+            tracking=True,
+            alt=70.000,
+            az=30.000,
+            pa=206.265,
+            rot=15.000,
+            telaz=30.000,
+            telrot=15.000,
         )
 
     def test_slew_radec(self):
         self.model.update_state(0)
-        # Use old values, to avoid updating final states.
-        self.model.params.domaz_free_range = 0
-        self.model.params.optics_cl_delay = [0, 20.0]
-        self.model.params.rotator_followsky = True
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
+        self.preset_old_values(rotator_followsky=True)
         self.model.slew_radec(
             0, math.radians(80), math.radians(0), math.radians(0), "r"
         )
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=68.0 ra=80.000 dec=0.000 ang=180.000 "
-            "filter=r track=True alt=33.540 az=67.263 pa=232.821 rot=52.821 "
-            "telaz=67.263 telrot=52.821 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
+        self.check_state(
+            self.model.current_state,
+            time=68.0,
+            ra=80.000,
+            dec=0.000,
+            ang=180.000,
+            band_filter="r",
+            tracking=True,
+            alt=33.540,
+            az=67.263,
+            pa=232.821,
+            rot=52.821,
+            telaz=67.263,
+            telrot=52.821,
         )
 
         self.model.update_state(100)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=100.0 ra=80.000 dec=0.000 ang=180.000 "
-            "filter=r track=True alt=33.650 az=67.163 pa=232.766 rot=52.766 "
-            "telaz=67.163 telrot=52.766 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
+        self.check_state(
+            self.model.current_state,
+            time=100.0,
+            ra=80.000,
+            dec=0.000,
+            ang=180.000,
+            band_filter="r",
+            tracking=True,
+            alt=33.650,
+            az=67.163,
+            pa=232.766,
+            rot=52.766,
+            telaz=67.163,
+            telrot=52.766,
         )
         self.model.slew_radec(
             100, math.radians(70), math.radians(-30), math.radians(15), "r"
         )
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=144.9 ra=70.000 dec=-30.000 ang=195.000 "
-            "filter=r track=True alt=55.654 az=99.940 pa=259.282 rot=64.282 "
-            "telaz=99.940 telrot=64.282 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-
-    def test_get_slew_delay(self):
+        self.check_state(
+            self.model.current_state,
+            time=144.9,
+            ra=70.000,
+            dec=-30.000,
+            ang=195.000,
+            band_filter="r",
+            tracking=True,
+            alt=55.654,
+            az=99.940,
+            pa=259.282,
+            rot=64.282,
+            telaz=99.940,
+            telrot=64.282,
+        )
+
+    def check_slew_delays(self, rotator_delay):
+        """Run the slew delay scenario shared by the followsky tests.
+
+        Only the final slew, which moves the sky angle, depends on
+        rotator_followsky; its expected delay is rotator_delay.
+        """
         self.model.update_state(0)
-        # Use old values, to avoid updating final states.
-        self.model.params.rotator_followsky = True
-
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
         # This slew will include a CL optics correction.
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
-        target.filter = "r"
+        target = make_target(60, -20, 0, "r")
 
         delay, status = self.model.get_slew_delay(target)
         self.assertAlmostEqual(delay, 85.507, delta=1e-3)
@@ -506,10 +439,6 @@ class ObservatoryModelTest(unittest.TestCase):
         self.model.slew(target)
 
         # This slew simply includes a filter change.
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
         target.filter = "g"
 
         delay, status = self.model.get_slew_delay(target)
@@ -517,7 +446,6 @@ class ObservatoryModelTest(unittest.TestCase):
 
         # This slew does not include OL correction, but does involve dome
         # crawl.
-        target = Target()
         target.ra_rad = math.radians(50)
         target.dec_rad = math.radians(-10)
         target.ang_rad = math.radians(10)
@@ -531,146 +459,73 @@ class ObservatoryModelTest(unittest.TestCase):
         delay, status = self.model.get_slew_delay(target)
         self.assertAlmostEqual(delay, 2.0, delta=1e-3)
 
-        # This slew involves rotator.
+        # This slew involves rotator, unless it does not follow the sky.
         target.ang_rad = math.radians(15)
         delay, status = self.model.get_slew_delay(target)
-        self.assertAlmostEqual(delay, 4.472, delta=1e-3)
+        self.assertAlmostEqual(delay, rotator_delay, delta=1e-3)
+
+    def test_get_slew_delay(self):
+        self.model.params.rotator_followsky = True
+        self.check_slew_delays(rotator_delay=4.472)
 
     def test_get_approximateSlewTime(self):
         self.model.update_state(0)
-        alt = np.array([self.model.current_state.telalt_rad])
-        az = np.array([self.model.current_state.telaz_rad])
+        telalt = self.model.current_state.telalt_rad
+        telaz = self.model.current_state.telaz_rad
         f = self.model.current_state.filter
-        # Check that slew time is == readout time for no motion
-        slewtime = self.model.get_approximate_slew_delay(alt, az, f)
-        self.assertEqual(slewtime, 2.0)
-        # Check that slew time is == filter change time for filter change
         newfilter = "u"
         if f == newfilter:
             newfilter = "g"
-        slewtime = self.model.get_approximate_slew_delay(alt, az, newfilter)
-        self.assertEqual(slewtime, 120.0)
-        # Check that get nan when attempting to slew out of bounds
-        alt = np.array([np.radians(90), np.radians(0), np.radians(-20)], float)
-        az = np.zeros(len(alt), float)
-        slewtime = self.model.get_approximate_slew_delay(alt, az, f)
-        self.assertTrue(np.all(slewtime < 0))
+        # All the scenarios go through a single call:
+        # [0] no motion, [1] filter change only, [2:5] out of bounds,
+        # [5:] a sweep over the sky.
+        alt = np.concatenate(([telalt, telalt], self.out_of_bounds_alt, self.sweep_alt))
+        az = np.concatenate(([telaz, telaz], self.out_of_bounds_az, self.sweep_az))
+        filters = np.full(len(alt), f)
+        filters[1] = newfilter
+        slewtime = self.model.get_approximate_slew_delay(alt, az, filters)
         # Check that we can calculate slew times with an array.
-        alt = np.radians(np.arange(0, 90, 1))
-        az = np.radians(np.arange(0, 180, 2))
-        slewtime = self.model.get_approximate_slew_delay(alt, az, f)
-        self.assertEqual(len(slewtime), len(alt))
+        self.assertEqual(slewtime.shape, alt.shape)
+        # Check that slew time is == readout time for no motion
+        self.assertEqual(slewtime[0], 2.0)
+        # Check that slew time is == filter change time for filter change
+        self.assertEqual(slewtime[1], 120.0)
+        # Check that get nan when attempting to slew out of bounds
+        np.testing.assert_array_less(slewtime[2:5], 0.0)
 
     def test_get_slew_delay_followsky_false(self):
-        # Test slew time without followsky option. Similar to
-        # test_get_slew_delay above.
-        self.model.update_state(0)
+        # Without followsky the rotator stays put when the sky angle changes.
         self.model.params.rotator_followsky = False
-        expected_state = (
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']"
-        )
-        self.assertEqual(str(self.model.current_state), expected_state)
-
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
-        target.filter = "r"
-
-        delay, status = self.model.get_slew_delay(target)
-        self.assertAlmostEqual(delay, 85.507, delta=1e-3)
-
-        self.model.slew(target)
-
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
-        target.filter = "g"
+        self.check_slew_delays(rotator_delay=2.0)
 
-        delay, status = self.model.get_slew_delay(target)
-        self.assertAlmostEqual(delay, 120, delta=1e-3)
-
-        target = Target()
-        target.ra_rad = math.radians(50)
-        target.dec_rad = math.radians(-10)
-        target.ang_rad = math.radians(10)
-        target.filter = "r"
-
-        delay, status = self.model.get_slew_delay(target)
-        self.assertAlmostEqual(delay, 17.913, delta=1e-3)
-
-        self.model.slew(target)
-        delay, status = self.model.get_slew_delay(target)
-        self.assertAlmostEqual(delay, 2.0, delta=1e-3)
-
-        # Here is the difference when using followsky = False
-        target.ang_rad = math.radians(15)
-        delay, status = self.model.get_slew_delay(target)
-        self.assertAlmostEqual(delay, 2.0, delta=1e-3)
-
-    def test_slew(self):
+    def check_slew_sequence(self, cases, check_delays):
+        """Slew through cases in order, checking the state after each slew
+        and, if check_delays, the recorded slew delays.
+        """
         self.model.update_state(0)
-        self.model.params.domaz_free_range = 0
-        self.model.params.optics_cl_delay = [0, 20.0]
-        self.model.params.rotator_followsky = True
+        self.preset_old_values(rotator_followsky=True)
+
+        for target_args, state, delays, critical_path, peakspeeds in cases:
+            with self.subTest(target=target_args):
+                self.model.slew(make_target(*target_args))
+                self.check_state(
+                    self.model.current_state,
+                    band_filter=target_args[3],
+                    tracking=True,
+                    **state,
+                )
+                if check_delays:
+                    self.check_delay_and_state(
+                        self.model, delays, critical_path, peakspeeds
+                    )
 
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
-        target.filter = "r"
-
-        self.model.slew(target)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=74.2 ra=60.000 dec=-20.000 ang=180.000 "
-            "filter=r track=True alt=60.904 az=76.495 pa=243.368 rot=63.368 "
-            "telaz=76.495 telrot=63.368 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
-        target.filter = "i"
-
-        self.model.slew(target)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=194.2 ra=60.000 dec=-20.000 ang=180.000 "
-            "filter=i track=True alt=61.324 az=76.056 pa=243.156 rot=63.156 "
-            "telaz=76.056 telrot=63.156 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
+    def test_slew(self):
+        self.check_slew_sequence(SLEW_SEQUENCE[:2], check_delays=False)
 
     def test_domecrawl(self):
         self.model.update_state(0)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
 
-        target = Target()
-        target.ra_rad = math.radians(35)
-        target.dec_rad = math.radians(-27)
-        target.ang_rad = math.radians(0)
-        target.filter = "r"
+        target = make_target(35, -27, 0, "r")
 
         # Just test whether dome crawl is faster or not.
         # If we test the final slew state, this is including other aspects of
@@ -682,200 +537,110 @@ class ObservatoryModelTest(unittest.TestCase):
         self.assertTrue(delay_crawl < delay_nocrawl)
 
     def test_slewdata(self):
-        self.model.update_state(0)
-        # Use old values, to avoid updating final states.
-        self.model.params.domaz_free_range = 0
-        self.model.params.optics_cl_delay = [0, 20.0]
-        self.model.params.rotator_followsky = True
-
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
-        target.filter = "r"
+        self.check_slew_sequence(SLEW_SEQUENCE, check_delays=True)
 
-        self.model.slew(target)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=74.2 ra=60.000 dec=-20.000 ang=180.000 "
-            "filter=r track=True alt=60.904 az=76.495 pa=243.368 rot=63.368 "
-            "telaz=76.495 telrot=63.368 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-        self.check_delay_and_state(
-            self.model,
-            self.make_slewact_dict(
-                (8.387, 11.966, 21.641, 7.387, 20.0, 18.775, 53.174, 1.0, 0.0, 2.0)
-            ),
-            ["telopticsclosedloop", "domazsettle", "domaz"],
-            (-3.50, 7.00, 3.50, -1.75, 1.50),
-        )
-
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
-        target.filter = "i"
-
-        self.model.slew(target)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=194.2 ra=60.000 dec=-20.000 ang=180.000 "
-            "filter=i track=True alt=61.324 az=76.056 pa=243.156 rot=63.156 "
-            "telaz=76.056 telrot=63.156 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
+    def check_rotator_slews(self, rotator_followsky, expected_states):
+        """Slew from the initial state to two nearby fields, checking the
+        state after each slew against expected_states.
+        """
+        self.preset_old_values(rotator_followsky=rotator_followsky)
+        self.model.update_state(0)
+        states = self.model.slew_radec_batch(
+            0, np.radians([80, 83.5]), np.radians([0, 0]), np.radians([0, 0]), "r"
         )
-        self.check_delay_and_state(
-            self.model,
-            self.make_slewact_dict(
-                (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 120.0, 2.0)
-            ),
-            ["filter"],
-            (0, 0, 0, 0, 0),
+        self.assertEqual(len(states), len(expected_states))
+        for state, expected in zip(states, expected_states):
+            self.check_state(state, band_filter="r", tracking=True, **expected)
+        self.check_state(
+            self.model.current_state,
+            band_filter="r",
+            tracking=True,
+            **expected_states[-1],
         )
 
-        target = Target()
-        target.ra_rad = math.radians(61)
-        target.dec_rad = math.radians(-21)
-        target.ang_rad = math.radians(1)
-        target.filter = "i"
-
-        self.model.slew(target)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=199.0 ra=61.000 dec=-21.000 ang=181.000 "
-            "filter=i track=True alt=60.931 az=78.751 pa=245.172 rot=64.172 "
-            "telaz=78.751 telrot=64.172 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-        self.check_delay_and_state(
-            self.model,
-            self.make_slewact_dict(
-                (0.683, 1.244, 2.022, 0.117, 0.0, 1.365, 3.801, 1.0, 0.000, 2.000)
-            ),
-            ["domazsettle", "domaz"],
-            (-1.194, 4.354, 1.011, -0.598, 1.425),
-        )
+    def test_slew_radec_batch_filter_mismatch(self):
+        self.model.update_state(0)
+        with self.assertRaises(ValueError):
+            self.model.slew_radec_batch(
+                0, np.radians([80, 83.5]), np.radians([0, 0]), 0.0, ["r"]
+            )
+        self.check_state(self.model.current_state, **INITIAL_STATE)
 
     def test_rotator_followsky_true(self):
-        # Use old values, to avoid updating final states.
-        self.model.params.domaz_free_range = 0
-        self.model.params.optics_cl_delay = [0, 20.0]
-
-        self.model.update_state(0)
-        self.model.params.rotator_followsky = True
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-        self.model.slew_radec(
-            0, math.radians(80), math.radians(0), math.radians(0), "r"
-        )
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=68.0 ra=80.000 dec=0.000 ang=180.000 "
-            "filter=r track=True alt=33.540 az=67.263 pa=232.821 rot=52.821 "
-            "telaz=67.263 telrot=52.821 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-        self.model.slew_radec(
-            0, math.radians(83.5), math.radians(0), math.radians(0), "r"
-        )
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=72.8 ra=83.500 dec=0.000 ang=180.000 "
-            "filter=r track=True alt=30.744 az=69.709 pa=234.123 rot=54.123 "
-            "telaz=69.709 telrot=54.123 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
+        self.check_rotator_slews(
+            True,
+            [
+                dict(
+                    time=68.0,
+                    ra=80.000,
+                    dec=0.000,
+                    ang=180.000,
+                    alt=33.540,
+                    az=67.263,
+                    pa=232.821,
+                    rot=52.821,
+                    telaz=67.263,
+                    telrot=52.821,
+                ),
+                dict(
+                    time=72.8,
+                    ra=83.500,
+                    dec=0.000,
+                    ang=180.000,
+                    alt=30.744,
+                    az=69.709,
+                    pa=234.123,
+                    rot=54.123,
+                    telaz=69.709,
+                    telrot=54.123,
+                ),
+            ],
         )
 
     def test_rotator_followsky_false(self):
-        # Use old values, to avoid updating final states.
-        self.model.update_state(0)
-        self.model.params.domaz_free_range = 0
-        self.model.params.optics_cl_delay = [0, 20.0]
-        self.model.params.rotator_followsky = False
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-        self.model.slew_radec(
-            0, math.radians(80), math.radians(0), math.radians(0), "r"
-        )
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=68.0 ra=80.000 dec=0.000 ang=232.933 "
-            "filter=r track=True alt=33.540 az=67.263 pa=232.821 rot=359.888 "
-            "telaz=67.263 telrot=-0.112 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-        self.model.slew_radec(
-            0, math.radians(83.5), math.radians(0), math.radians(0), "r"
-        )
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=72.8 ra=83.500 dec=0.000 ang=234.241 "
-            "filter=r track=True alt=30.744 az=69.709 pa=234.123 rot=359.881 "
-            "telaz=69.709 telrot=-0.119 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
+        self.check_rotator_slews(
+            False,
+            [
+                dict(
+                    time=68.0,
+                    ra=80.000,
+                    dec=0.000,
+                    ang=232.933,
+                    alt=33.540,
+                    az=67.263,
+                    pa=232.821,
+                    rot=359.888,
+                    telaz=67.263,
+                    telrot=-0.112,
+                ),
+                dict(
+                    time=72.8,
+                    ra=83.500,
+                    dec=0.000,
+                    ang=234.241,
+                    alt=30.744,
+                    az=69.709,
+                    pa=234.123,
+                    rot=359.881,
+                    telaz=69.709,
+                    telrot=-0.119,
+                ),
+            ],
         )
 
     def test_swap_filter(self):
-        # Use old values, to avoid updating final states.
-        self.model.params.domaz_free_range = 0
-        self.model.params.optics_cl_delay = [0, 20.0]
-        self.model.params.rotator_followsky = True
+        self.preset_old_values(rotator_followsky=True)
         self.model.update_state(0)
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
-        self.assertEqual(
-            str(self.model.park_state),
-            "t=0.0 ra=0.000 dec=0.000 ang=0.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=0.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']",
-        )
+        self.check_state(self.model.park_state, **PARK_STATE)
+        # A filter swap only changes the filter lists, in both states.
         self.model.swap_filter("z")
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'y', 'u'] unmounted=['z']",
-        )
-        self.assertEqual(
-            str(self.model.park_state),
-            "t=0.0 ra=0.000 dec=0.000 ang=0.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=0.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'y', 'u'] unmounted=['z']",
-        )
+        for state in (self.model.current_state, self.model.park_state):
+            self.assertTupleEqual(state.mountedfilters, ("g", "r", "i", "y", "u"))
+            self.assertTupleEqual(state.unmountedfilters, ("z",))
         self.model.swap_filter("u")
-        self.assertEqual(
-            str(self.model.current_state),
-            "t=0.0 ra=29.480 dec=-26.744 ang=180.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=180.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'y', 'z'] unmounted=['u']",
-        )
-        self.assertEqual(
-            str(self.model.park_state),
-            "t=0.0 ra=0.000 dec=0.000 ang=0.000 "
-            "filter=r track=False alt=86.500 az=0.000 pa=0.000 rot=0.000 "
-            "telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'y', 'z'] unmounted=['u']",
-        )
+        for state in (self.model.current_state, self.model.park_state):
+            self.assertTupleEqual(state.mountedfilters, ("g", "r", "i", "y", "z"))
+            self.assertTupleEqual(state.unmountedfilters, ("u",))
 
     def test_park(self):
         self.model.update_state(0)
@@ -883,44 +648,113 @@ class ObservatoryModelTest(unittest.TestCase):
         self.model.params.rotator_resume_angle = False
         # Start at park, slew to target.
         # Use default configuration (dome crawl, CL updates, etc.)
-        target = Target()
-        target.ra_rad = math.radians(60)
-        target.dec_rad = math.radians(-20)
-        target.ang_rad = math.radians(0)
-        target.filter = "z"
+        target = make_target(60, -20, 0, "z")
 
         self.model.slew(target)
-        expected_state = (
-            "t=156.0 ra=60.000 dec=-20.000 ang=243.495 filter=z track=True "
-            "alt=61.191 az=76.196 pa=243.224 rot=359.729 telaz=76.196 telrot=-0.271 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']"
+        self.check_state(
+            self.model.current_state,
+            time=156.0,
+            ra=60.000,
+            dec=-20.000,
+            ang=243.495,
+            band_filter="z",
+            tracking=True,
+            alt=61.191,
+            az=76.196,
+            pa=243.224,
+            rot=359.729,
+            telaz=76.196,
+            telrot=-0.271,
         )
-        self.assertEqual(str(self.model.current_state), expected_state)
         self.check_delay_and_state(
             self.model,
-            self.make_slewact_dict(
-                (8.387, 11.966, 0.0, 7.387, 36.0, 18.775, 48.507, 1.0, 120.0, 2.0)
-            ),
+            (8.387, 11.966, 0.0, 7.387, 36.0, 18.775, 48.507, 1.0, 120.0, 2.0),
             ["telopticsclosedloop", "filter"],
             (-3.50, 7.00, 0.0, -1.75, 1.50),
         )
 
         self.model.park()
-        expected_state = (
-            "t=241.1 ra=30.487 dec=-26.744 ang=180.000 filter=z track=False "
-            "alt=86.500 az=0.000 pa=180.000 rot=0.000 telaz=0.000 telrot=0.000 "
-            "mounted=['g', 'r', 'i', 'z', 'y'] unmounted=['u']"
+        self.check_state(
+            self.model.current_state,
+            time=241.1,
+            ra=30.487,
+            dec=-26.744,
+            ang=180.000,
+            band_filter="z",
+            tracking=False,
+            alt=86.500,
+            az=0.000,
+            pa=180.000,
+            rot=0.000,
+            telaz=0.000,
+            telrot=0.000,
         )
-        self.assertEqual(str(self.model.current_state), expected_state)
         self.check_delay_and_state(
             self.model,
-            self.make_slewact_dict(
-                (8.231, 11.885, 1.041, 7.231, 36.0, 18.462, 48.130, 1.0, 0.0, 2.0)
-            ),
+            (8.231, 11.885, 1.041, 7.231, 36.0, 18.462, 48.130, 1.0, 0.0, 2.0),
             ["telopticsclosedloop", "domazsettle", "domaz"],
             (3.50, -7.00, 0.520, 1.75, -1.50),
         )
 
+
+class ClosestAngleDistanceTest(unittest.TestCase):
+    # The closest angle queries do not use the model state, so these tests
+    # need neither configuration nor a reset before each test.
+    @classmethod
+    def setUpClass(cls):
+        cls.model = ObservatoryModel()
+
+    def check_closest_angle_distance(self, table, min_abs=None, max_abs=None):
+        if min_abs is not None:
+            min_abs = math.radians(min_abs)
+        if max_abs is not None:
+            max_abs = math.radians(max_abs)
+        angles, currents, targets, distances = np.radians(table).T
+        for angle, current, target, distance in zip(
+            angles, currents, targets, distances
+        ):
+            with self.subTest(angle=math.degrees(angle), current=math.degrees(current)):
+                final_abs_rad, distance_rad = self.model.get_closest_angle_distance(
+                    angle, current, min_abs, max_abs
+                )
+                self.assertAlmostEqual(final_abs_rad, target, places=12)
+                self.assertAlmostEqual(distance_rad, distance, places=12)
+        final_abs_rad, distance_rad = self.model._get_closest_angle_distance_batch(
+            angles, currents, min_abs, max_abs
+        )
+        np.testing.assert_allclose(final_abs_rad, targets, atol=1e-12)
+        np.testing.assert_allclose(distance_rad, distances, atol=1e-12)
+
+    def test_get_closest_angle_distance_unlimited(self):
+        self.check_closest_angle_distance(CLOSEST_ANGLE_UNLIMITED)
+
+    def test_get_closest_angle_distance_cable_wrap270(self):
+        self.check_closest_angle_distance(CLOSEST_ANGLE_CABLE_WRAP270, -270, 270)
+
+    def test_get_closest_angle_distance_cable_wrap270_grid(self):
+        table = [
+            (angle, current) + closest_angle_oracle(angle, current, -270, 270)
+            for angle, current in itertools.product(
+                range(-360, 361, 45), (0, 180, -180)
+            )
+        ]
+        self.check_closest_angle_distance(table, -270, 270)
+
+    def test_get_closest_angle_distance_cable_wrap90(self):
+        self.check_closest_angle_distance(CLOSEST_ANGLE_CABLE_WRAP90, -90, 90)
+
+
+class ReadOnlyModelTest(unittest.TestCase):
+    """Tests that never change the model, so they share one instance."""
+
+    @classmethod
+    def setUpClass(cls):
+        location = ObservatoryLocation()
+        location.for_lsst()
+
+        cls.model = ObservatoryModel(location)
+        cls.model.configure_from_module()
+
     def test_get_deep_drilling_time(self):
         target = Target()
         target.is_deep_drilling = True
@@ -939,6 +773,14 @@ class ObservatoryModelTest(unittest.TestCase):
         self.assertEqual(len(cd["telescope"]), 11)
         self.assertEqual(len(cd["camera"]), 10)
 
+        cd["telescope"]["altitude_minpos"] = 0.0
+        self.assertEqual(
+            ObservatoryModel.get_configure_dict(), ObservatoryModel.get_configure_dict()
+        )
+        self.assertNotEqual(
+            ObservatoryModel.get_configure_dict()["telescope"]["altitude_minpos"], 0.0
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
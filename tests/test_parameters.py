@@ -23,6 +23,76 @@ import unittest
 
 from lsst.ts.observatory.model import ObservatoryModelParameters
 
+# Configuration truths, with their angular values converted once to radians.
+ANGULAR_KEY_SUFFIXES = (
+    "minpos",
+    "maxpos",
+    "maxspeed",
+    "accel",
+    "decel",
+    "freerange",
+    "filter_change_pos",
+)
+
+
+def angular_truth_rad(truth):
+    """Convert the angular entries of a configuration section to radians."""
+    return {
+        key: math.radians(value)
+        for key, value in truth.items()
+        if key.endswith(ANGULAR_KEY_SUFFIXES)
+    }
+
+
+TELESCOPE_TRUTH = {
+    "telescope": {
+        "altitude_minpos": 15.0,
+        "altitude_maxpos": 85.0,
+        "azimuth_minpos": -90.0,
+        "azimuth_maxpos": 90.0,
+        "altitude_maxspeed": 10.0,
+        "altitude_accel": 3.0,
+        "altitude_decel": 3.0,
+        "azimuth_maxspeed": 8.0,
+        "azimuth_accel": 2.0,
+        "azimuth_decel": 2.0,
+        "settle_time": 1.0,
+    }
+}
+
+TELESCOPE_TRUTH_RAD = angular_truth_rad(TELESCOPE_TRUTH["telescope"])
+
+ROTATOR_TRUTH = {
+    "rotator": {
+        "minpos": -90.0,
+        "maxpos": 90.0,
+        "maxspeed": 4.0,
+        "accel": 1.0,
+        "decel": 1.0,
+        "filter_change_pos": 45.0,
+        "follow_sky": True,
+        "resume_angle": False,
+    }
+}
+
+ROTATOR_TRUTH_RAD = angular_truth_rad(ROTATOR_TRUTH["rotator"])
+
+DOME_TRUTH = {
+    "dome": {
+        "altitude_maxspeed": 6.0,
+        "altitude_accel": 1.5,
+        "altitude_decel": 1.5,
+        "altitude_freerange": 0.0,
+        "azimuth_maxspeed": 4.0,
+        "azimuth_accel": 0.5,
+        "azimuth_decel": 0.5,
+        "azimuth_freerange": 0.0,
+        "settle_time": 3.0,
+    }
+}
+
+DOME_TRUTH_RAD = angular_truth_rad(DOME_TRUTH["dome"])
+
 
 class ObservatoryModelParametersTest(unittest.TestCase):
     def setUp(self):
@@ -37,138 +107,70 @@ class ObservatoryModelParametersTest(unittest.TestCase):
         self.assertDictEqual(self.params.prerequisites, {})
 
     def test_configure_telescope(self):
-        truth = {
-            "telescope": {
-                "altitude_minpos": 15.0,
-                "altitude_maxpos": 85.0,
-                "azimuth_minpos": -90.0,
-                "azimuth_maxpos": 90.0,
-                "altitude_maxspeed": 10.0,
-                "altitude_accel": 3.0,
-                "altitude_decel": 3.0,
-                "azimuth_maxspeed": 8.0,
-                "azimuth_accel": 2.0,
-                "azimuth_decel": 2.0,
-                "settle_time": 1.0,
-            }
-        }
-        self.params.configure_telescope(truth)
+        self.params.configure_telescope(TELESCOPE_TRUTH)
         self.assertEqual(
-            self.params.telalt_minpos_rad,
-            math.radians(truth["telescope"]["altitude_minpos"]),
+            self.params.telalt_minpos_rad, TELESCOPE_TRUTH_RAD["altitude_minpos"]
         )
         self.assertEqual(
-            self.params.telalt_maxpos_rad,
-            math.radians(truth["telescope"]["altitude_maxpos"]),
+            self.params.telalt_maxpos_rad, TELESCOPE_TRUTH_RAD["altitude_maxpos"]
         )
         self.assertEqual(
-            self.params.telaz_minpos_rad,
-            math.radians(truth["telescope"]["azimuth_minpos"]),
+            self.params.telaz_minpos_rad, TELESCOPE_TRUTH_RAD["azimuth_minpos"]
         )
         self.assertEqual(
-            self.params.telaz_maxpos_rad,
-            math.radians(truth["telescope"]["azimuth_maxpos"]),
+            self.params.telaz_maxpos_rad, TELESCOPE_TRUTH_RAD["azimuth_maxpos"]
         )
         self.assertEqual(
-            self.params.telalt_maxspeed_rad,
-            math.radians(truth["telescope"]["altitude_maxspeed"]),
+            self.params.telalt_maxspeed_rad, TELESCOPE_TRUTH_RAD["altitude_maxspeed"]
         )
         self.assertEqual(
-            self.params.telalt_accel_rad,
-            math.radians(truth["telescope"]["altitude_accel"]),
+            self.params.telalt_accel_rad, TELESCOPE_TRUTH_RAD["altitude_accel"]
         )
         self.assertEqual(
-            self.params.telalt_decel_rad,
-            math.radians(truth["telescope"]["altitude_decel"]),
+            self.params.telalt_decel_rad, TELESCOPE_TRUTH_RAD["altitude_decel"]
         )
         self.assertEqual(
-            self.params.telaz_maxspeed_rad,
-            math.radians(truth["telescope"]["azimuth_maxspeed"]),
+            self.params.telaz_maxspeed_rad, TELESCOPE_TRUTH_RAD["azimuth_maxspeed"]
         )
         self.assertEqual(
-            self.params.telaz_accel_rad,
-            math.radians(truth["telescope"]["azimuth_accel"]),
+            self.params.telaz_accel_rad, TELESCOPE_TRUTH_RAD["azimuth_accel"]
         )
         self.assertEqual(
-            self.params.telaz_decel_rad,
-            math.radians(truth["telescope"]["azimuth_decel"]),
+            self.params.telaz_decel_rad, TELESCOPE_TRUTH_RAD["azimuth_decel"]
         )
         self.assertEqual(
-            self.params.mount_settletime, truth["telescope"]["settle_time"]
+            self.params.mount_settletime, TELESCOPE_TRUTH["telescope"]["settle_time"]
         )
 
     def test_configure_rotator(self):
-        truth = {
-            "rotator": {
-                "minpos": -90.0,
-                "maxpos": 90.0,
-                "maxspeed": 4.0,
-                "accel": 1.0,
-                "decel": 1.0,
-                "filter_change_pos": 45.0,
-                "follow_sky": True,
-                "resume_angle": False,
-            }
-        }
-        self.params.configure_rotator(truth)
-        self.assertEqual(
-            self.params.telrot_minpos_rad, math.radians(truth["rotator"]["minpos"])
-        )
-        self.assertEqual(
-            self.params.telrot_maxpos_rad, math.radians(truth["rotator"]["maxpos"])
-        )
-        self.assertEqual(
-            self.params.telrot_maxspeed_rad, math.radians(truth["rotator"]["maxspeed"])
-        )
-        self.assertEqual(
-            self.params.telrot_accel_rad, math.radians(truth["rotator"]["accel"])
-        )
-        self.assertEqual(
-            self.params.telrot_decel_rad, math.radians(truth["rotator"]["decel"])
-        )
+        self.params.configure_rotator(ROTATOR_TRUTH)
+        self.assertEqual(self.params.telrot_minpos_rad, ROTATOR_TRUTH_RAD["minpos"])
+        self.assertEqual(self.params.telrot_maxpos_rad, ROTATOR_TRUTH_RAD["maxpos"])
+        self.assertEqual(self.params.telrot_maxspeed_rad, ROTATOR_TRUTH_RAD["maxspeed"])
+        self.assertEqual(self.params.telrot_accel_rad, ROTATOR_TRUTH_RAD["accel"])
+        self.assertEqual(self.params.telrot_decel_rad, ROTATOR_TRUTH_RAD["decel"])
         self.assertEqual(
             self.params.telrot_filterchangepos_rad,
-            math.radians(truth["rotator"]["filter_change_pos"]),
+            ROTATOR_TRUTH_RAD["filter_change_pos"],
         )
         self.assertTrue(self.params.rotator_followsky)
         self.assertFalse(self.params.rotator_resumeangle)
 
     def test_configure_dome(self):
-        truth = {
-            "dome": {
-                "altitude_maxspeed": 6.0,
-                "altitude_accel": 1.5,
-                "altitude_decel": 1.5,
-                "altitude_freerange": 0.0,
-                "azimuth_maxspeed": 4.0,
-                "azimuth_accel": 0.5,
-                "azimuth_decel": 0.5,
-                "azimuth_freerange": 0.0,
-                "settle_time": 3.0,
-            }
-        }
-        self.params.configure_dome(truth)
-        self.assertEqual(
-            self.params.domalt_maxspeed_rad,
-            math.radians(truth["dome"]["altitude_maxspeed"]),
-        )
+        self.params.configure_dome(DOME_TRUTH)
         self.assertEqual(
-            self.params.domalt_accel_rad, math.radians(truth["dome"]["altitude_accel"])
+            self.params.domalt_maxspeed_rad, DOME_TRUTH_RAD["altitude_maxspeed"]
         )
+        self.assertEqual(self.params.domalt_accel_rad, DOME_TRUTH_RAD["altitude_accel"])
+        self.assertEqual(self.params.domalt_decel_rad, DOME_TRUTH_RAD["altitude_decel"])
         self.assertEqual(
-            self.params.domalt_decel_rad, math.radians(truth["dome"]["altitude_decel"])
+            self.params.domaz_maxspeed_rad, DOME_TRUTH_RAD["azimuth_maxspeed"]
         )
+        self.assertEqual(self.params.domaz_accel_rad, DOME_TRUTH_RAD["azimuth_accel"])
+        self.assertEqual(self.params.domaz_decel_rad, DOME_TRUTH_RAD["azimuth_decel"])
         self.assertEqual(
-            self.params.domaz_maxspeed_rad,
-            math.radians(truth["dome"]["azimuth_maxspeed"]),
+            self.params.domaz_settletime, DOME_TRUTH["dome"]["settle_time"]
         )
-        self.assertEqual(
-            self.params.domaz_accel_rad, math.radians(truth["dome"]["azimuth_accel"])
-        )
-        self.assertEqual(
-            self.params.domaz_decel_rad, math.radians(truth["dome"]["azimuth_decel"])
-        )
-        self.assertEqual(self.params.domaz_settletime, truth["dome"]["settle_time"])
 
     def test_configure_optics(self):
         truth = {
@@ -264,16 +266,24 @@ class ObservatoryModelParametersTest(unittest.TestCase):
         }
         self.params.configure_slew(truth, truth_activities)
         slew = truth["slew"]
-        self.assertListEqual(self.params.prerequisites["telalt"], slew["prereq_telalt"])
-        self.assertListEqual(self.params.prerequisites["telaz"], slew["prereq_telaz"])
-        self.assertListEqual(self.params.prerequisites["domalt"], slew["prereq_domalt"])
-        self.assertListEqual(self.params.prerequisites["domaz"], slew["prereq_domaz"])
-        self.assertListEqual(
-            self.params.prerequisites["exposures"], slew["prereq_exposures"]
+        self.assertTupleEqual(
+            self.params.prerequisites["telalt"], tuple(slew["prereq_telalt"])
         )
-        self.assertListEqual(
+        self.assertTupleEqual(
+            self.params.prerequisites["telaz"], tuple(slew["prereq_telaz"])
+        )
+        self.assertTupleEqual(
+            self.params.prerequisites["domalt"], tuple(slew["prereq_domalt"])
+        )
+        self.assertTupleEqual(
+            self.params.prerequisites["domaz"], tuple(slew["prereq_domaz"])
+        )
+        self.assertTupleEqual(
+            self.params.prerequisites["exposures"], tuple(slew["prereq_exposures"])
+        )
+        self.assertTupleEqual(
             self.params.prerequisites["telopticsclosedloop"],
-            slew["prereq_telopticsclosedloop"],
+            tuple(slew["prereq_telopticsclosedloop"]),
         )
 
 
@@ -18,44 +18,57 @@
 #
 # You should have received a copy of the GNU General Public License
 
-import math
+import numpy as np
 import unittest
 
 from lsst.ts.observatory.model import ObservatoryPosition
 
 
 class ObservatoryPositionTest(unittest.TestCase):
-    def setUp(self):
-        self.ra_truth = 41.010349
-        self.dec_truth = -19.985964
-        self.ang_truth = 175.993874013319
-        self.alt_truth = 79.6715648342188
-        self.az_truth = 353.018554127083
-        self.pa_truth = 173.584814234084
-        self.rot_truth = -2.40905977923582
+    @classmethod
+    def setUpClass(cls):
+        cls.ra_truth = 41.010349
+        cls.dec_truth = -19.985964
+        cls.ang_truth = 175.993874013319
+        cls.alt_truth = 79.6715648342188
+        cls.az_truth = 353.018554127083
+        cls.pa_truth = 173.584814234084
+        cls.rot_truth = -2.40905977923582
 
-        self.timestamp = 1672534239.91224
-        self.ra_rad_truth = math.radians(self.ra_truth)
-        self.dec_rad_truth = math.radians(self.dec_truth)
-        self.ang_rad_truth = math.radians(self.ang_truth)
-        self.band_filter_truth = "y"
-        self.tracking_truth = True
-        self.alt_rad_truth = math.radians(self.alt_truth)
-        self.az_rad_truth = math.radians(self.az_truth)
-        self.pa_rad_truth = math.radians(self.pa_truth)
-        self.rot_rad_truth = math.radians(self.rot_truth)
+        cls.timestamp = 1672534239.91224
+        (
+            cls.ra_rad_truth,
+            cls.dec_rad_truth,
+            cls.ang_rad_truth,
+            cls.alt_rad_truth,
+            cls.az_rad_truth,
+            cls.pa_rad_truth,
+            cls.rot_rad_truth,
+        ) = np.deg2rad(
+            [
+                cls.ra_truth,
+                cls.dec_truth,
+                cls.ang_truth,
+                cls.alt_truth,
+                cls.az_truth,
+                cls.pa_truth,
+                cls.rot_truth,
+            ]
+        ).tolist()
+        cls.band_filter_truth = "y"
+        cls.tracking_truth = True
 
-        self.op = ObservatoryPosition(
-            self.timestamp,
-            self.ra_rad_truth,
-            self.dec_rad_truth,
-            self.ang_rad_truth,
-            self.band_filter_truth,
-            self.tracking_truth,
-            self.alt_rad_truth,
-            self.az_rad_truth,
-            self.pa_rad_truth,
-            self.rot_rad_truth,
+        cls.op = ObservatoryPosition(
+            cls.timestamp,
+            cls.ra_rad_truth,
+            cls.dec_rad_truth,
+            cls.ang_rad_truth,
+            cls.band_filter_truth,
+            cls.tracking_truth,
+            cls.alt_rad_truth,
+            cls.az_rad_truth,
+            cls.pa_rad_truth,
+            cls.rot_rad_truth,
         )
 
     def test_basic_information_after_creation(self):
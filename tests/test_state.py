@@ -18,123 +18,160 @@
 #
 # You should have received a copy of the GNU General Public License
 
-import math
+import numpy as np
 import unittest
 
 from lsst.ts.observatory.model import ObservatoryState
 
+POSITION_FIELDS = ("ra", "dec", "ang", "alt", "az", "pa", "rot")
+PEAKSPEED_FIELDS = (
+    "telalt_peakspeed",
+    "telaz_peakspeed",
+    "telrot_peakspeed",
+    "domalt_peakspeed",
+    "domaz_peakspeed",
+)
+# Compared exactly; domaz_peakspeed only matches to one decimal place.
+STATE_FIELDS = ("telalt", "telaz", "telrot", "domalt", "domaz") + PEAKSPEED_FIELDS[:-1]
+
 
 class ObservatoryStateTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ra_truth = 41.010349
+        cls.dec_truth = -19.985964
+        cls.ang_truth = 175.993874013319
+        cls.alt_truth = 79.6715648342188
+        cls.az_truth = 353.018554127083
+        cls.pa_truth = 173.584814234084
+        cls.rot_truth = -2.40905977923582
+        cls.telalt_truth = 79.6715648342188
+        cls.telaz_truth = -6.98144587291673
+        cls.telrot_truth = -2.40905977923582
+        cls.domalt_truth = 79.6715648342188
+        cls.domaz_truth = -6.98144587291673
+        cls.telalt_peakspeed_truth = -3.5
+        cls.telaz_peakspeed_truth = -5.52367616573824
+        cls.telrot_peakspeed_truth = 0.0
+        cls.domalt_peakspeed_truth = -1.75
+        cls.domaz_peakspeed_truth = -1.5
+
+        cls.timestamp = 1672534239.91224
+        (
+            cls.ra_rad_truth,
+            cls.dec_rad_truth,
+            cls.ang_rad_truth,
+            cls.alt_rad_truth,
+            cls.az_rad_truth,
+            cls.pa_rad_truth,
+            cls.rot_rad_truth,
+            cls.telalt_rad_truth,
+            cls.telaz_rad_truth,
+            cls.telrot_rad_truth,
+            cls.domalt_rad_truth,
+            cls.domaz_rad_truth,
+            cls.telalt_peakspeed_rad_truth,
+            cls.telaz_peakspeed_rad_truth,
+            cls.telrot_peakspeed_rad_truth,
+            cls.domalt_peakspeed_rad_truth,
+            cls.domaz_peakspeed_rad_truth,
+        ) = np.deg2rad(
+            [
+                cls.ra_truth,
+                cls.dec_truth,
+                cls.ang_truth,
+                cls.alt_truth,
+                cls.az_truth,
+                cls.pa_truth,
+                cls.rot_truth,
+                cls.telalt_truth,
+                cls.telaz_truth,
+                cls.telrot_truth,
+                cls.domalt_truth,
+                cls.domaz_truth,
+                cls.telalt_peakspeed_truth,
+                cls.telaz_peakspeed_truth,
+                cls.telrot_peakspeed_truth,
+                cls.domalt_peakspeed_truth,
+                cls.domaz_peakspeed_truth,
+            ]
+        ).tolist()
+        cls.band_filter_truth = "y"
+        cls.tracking_truth = True
+        cls.mounted_filters_truth = ("g", "r", "i", "y", "u")
+        cls.unmounted_filters_truth = ("z",)
+
+        cls.obs_state_new = ObservatoryState(
+            cls.timestamp,
+            cls.ra_rad_truth,
+            cls.dec_rad_truth,
+            cls.ang_rad_truth,
+            cls.band_filter_truth,
+            cls.tracking_truth,
+            cls.alt_rad_truth,
+            cls.az_rad_truth,
+            cls.pa_rad_truth,
+            cls.rot_rad_truth,
+            cls.telalt_rad_truth,
+            cls.telaz_rad_truth,
+            cls.telrot_rad_truth,
+            cls.domalt_rad_truth,
+            cls.domaz_rad_truth,
+            cls.mounted_filters_truth,
+            cls.unmounted_filters_truth,
+        )
+        cls.obs_state_new.telalt_peakspeed_rad = cls.telalt_peakspeed_rad_truth
+        cls.obs_state_new.telaz_peakspeed_rad = cls.telaz_peakspeed_rad_truth
+        cls.obs_state_new.telrot_peakspeed_rad = cls.telrot_peakspeed_rad_truth
+        cls.obs_state_new.domalt_peakspeed_rad = cls.domalt_peakspeed_rad_truth
+        cls.obs_state_new.domaz_peakspeed_rad = cls.domaz_peakspeed_rad_truth
+
     def setUp(self):
         self.obs_state_default = ObservatoryState()
 
-        self.ra_truth = 41.010349
-        self.dec_truth = -19.985964
-        self.ang_truth = 175.993874013319
-        self.alt_truth = 79.6715648342188
-        self.az_truth = 353.018554127083
-        self.pa_truth = 173.584814234084
-        self.rot_truth = -2.40905977923582
-        self.telalt_truth = 79.6715648342188
-        self.telaz_truth = -6.98144587291673
-        self.telrot_truth = -2.40905977923582
-        self.domalt_truth = 79.6715648342188
-        self.domaz_truth = -6.98144587291673
-        self.telalt_peakspeed_truth = -3.5
-        self.telaz_peakspeed_truth = -5.52367616573824
-        self.telrot_peakspeed_truth = 0.0
-        self.domalt_peakspeed_truth = -1.75
-        self.domaz_peakspeed_truth = -1.5
-
-        self.timestamp = 1672534239.91224
-        self.ra_rad_truth = math.radians(self.ra_truth)
-        self.dec_rad_truth = math.radians(self.dec_truth)
-        self.ang_rad_truth = math.radians(self.ang_truth)
-        self.band_filter_truth = "y"
-        self.tracking_truth = True
-        self.alt_rad_truth = math.radians(self.alt_truth)
-        self.az_rad_truth = math.radians(self.az_truth)
-        self.pa_rad_truth = math.radians(self.pa_truth)
-        self.rot_rad_truth = math.radians(self.rot_truth)
-        self.telalt_rad_truth = math.radians(self.telalt_truth)
-        self.telaz_rad_truth = math.radians(self.telaz_truth)
-        self.telrot_rad_truth = math.radians(self.telrot_truth)
-        self.domalt_rad_truth = math.radians(self.domalt_truth)
-        self.domaz_rad_truth = math.radians(self.domaz_truth)
-        self.telalt_peakspeed_rad_truth = math.radians(self.telalt_peakspeed_truth)
-        self.telaz_peakspeed_rad_truth = math.radians(self.telaz_peakspeed_truth)
-        self.telrot_peakspeed_rad_truth = math.radians(self.telrot_peakspeed_truth)
-        self.domalt_peakspeed_rad_truth = math.radians(self.domalt_peakspeed_truth)
-        self.domaz_peakspeed_rad_truth = math.radians(self.domaz_peakspeed_truth)
-        self.mounted_filters_truth = ["g", "r", "i", "y", "u"]
-        self.unmounted_filters_truth = ["z"]
-
-        self.obs_state_new = ObservatoryState(
-            self.timestamp,
-            self.ra_rad_truth,
-            self.dec_rad_truth,
-            self.ang_rad_truth,
-            self.band_filter_truth,
-            self.tracking_truth,
-            self.alt_rad_truth,
-            self.az_rad_truth,
-            self.pa_rad_truth,
-            self.rot_rad_truth,
-            self.telalt_rad_truth,
-            self.telaz_rad_truth,
-            self.telrot_rad_truth,
-            self.domalt_rad_truth,
-            self.domaz_rad_truth,
-            self.mounted_filters_truth,
-            self.unmounted_filters_truth,
+    def check_fields(self, obs_state, fields, truths):
+        np.testing.assert_array_equal(
+            [getattr(obs_state, field) for field in fields], truths
         )
-        self.obs_state_new.telalt_peakspeed_rad = self.telalt_peakspeed_rad_truth
-        self.obs_state_new.telaz_peakspeed_rad = self.telaz_peakspeed_rad_truth
-        self.obs_state_new.telrot_peakspeed_rad = self.telrot_peakspeed_rad_truth
-        self.obs_state_new.domalt_peakspeed_rad = self.domalt_peakspeed_rad_truth
-        self.obs_state_new.domaz_peakspeed_rad = self.domaz_peakspeed_rad_truth
 
     def check_observatory_state(self, obs_state, position_only=False):
         self.assertEqual(obs_state.time, self.timestamp)
-        self.assertEqual(obs_state.ra, self.ra_truth)
-        self.assertEqual(obs_state.dec, self.dec_truth)
-        self.assertEqual(obs_state.ang, self.ang_truth)
         self.assertEqual(obs_state.filter, self.band_filter_truth)
         self.assertTrue(obs_state.tracking)
-        self.assertEqual(obs_state.alt, self.alt_truth)
-        self.assertEqual(obs_state.az, self.az_truth)
-        self.assertEqual(obs_state.pa, self.pa_truth)
-        self.assertEqual(obs_state.rot, self.rot_truth)
+        self.check_fields(
+            obs_state,
+            POSITION_FIELDS,
+            [getattr(self, f"{field}_truth") for field in POSITION_FIELDS],
+        )
         if not position_only:
-            self.assertEqual(obs_state.telalt, self.telalt_truth)
-            self.assertEqual(obs_state.telaz, self.telaz_truth)
-            self.assertEqual(obs_state.telrot, self.telrot_truth)
-            self.assertEqual(obs_state.domalt, self.domalt_truth)
-            self.assertEqual(obs_state.domaz, self.domaz_truth)
-            self.assertEqual(obs_state.telalt_peakspeed, self.telalt_peakspeed_truth)
-            self.assertEqual(obs_state.telaz_peakspeed, self.telaz_peakspeed_truth)
-            self.assertEqual(obs_state.telrot_peakspeed, self.telrot_peakspeed_truth)
-            self.assertEqual(obs_state.domalt_peakspeed, self.domalt_peakspeed_truth)
+            self.check_fields(
+                obs_state,
+                STATE_FIELDS,
+                [getattr(self, f"{field}_truth") for field in STATE_FIELDS],
+            )
             self.assertAlmostEqual(
                 obs_state.domaz_peakspeed, self.domaz_peakspeed_truth, places=1
             )
-            self.assertListEqual(obs_state.mountedfilters, self.mounted_filters_truth)
-            self.assertListEqual(
+            self.assertTupleEqual(obs_state.mountedfilters, self.mounted_filters_truth)
+            self.assertTupleEqual(
                 obs_state.unmountedfilters, self.unmounted_filters_truth
             )
         else:
-            self.assertEqual(obs_state.telalt, self.alt_truth)
-            self.assertEqual(obs_state.telaz, self.az_truth)
-            self.assertEqual(obs_state.telrot, self.rot_truth)
-            self.assertEqual(obs_state.domalt, self.alt_truth)
-            self.assertEqual(obs_state.domaz, self.az_truth)
-            self.assertEqual(obs_state.telalt_peakspeed, 0.0)
-            self.assertEqual(obs_state.telaz_peakspeed, 0.0)
-            self.assertEqual(obs_state.telrot_peakspeed, 0.0)
-            self.assertEqual(obs_state.domalt_peakspeed, 0.0)
-            self.assertEqual(obs_state.domaz_peakspeed, 0.0)
-            self.assertListEqual(obs_state.mountedfilters, ["g", "r", "i", "z", "y"])
-            self.assertListEqual(obs_state.unmountedfilters, ["u"])
+            # The telescope and dome follow the position, at rest.
+            self.check_fields(
+                obs_state,
+                ("telalt", "telaz", "telrot", "domalt", "domaz"),
+                [
+                    self.alt_truth,
+                    self.az_truth,
+                    self.rot_truth,
+                    self.alt_truth,
+                    self.az_truth,
+                ],
+            )
+            self.check_fields(obs_state, PEAKSPEED_FIELDS, [0.0] * 5)
+            self.assertTupleEqual(obs_state.mountedfilters, ("g", "r", "i", "z", "y"))
+            self.assertTupleEqual(obs_state.unmountedfilters, ("u",))
 
     def test_basic_information_after_default_creation(self):
         self.assertEqual(self.obs_state_default.time, 0.0)
@@ -152,10 +189,10 @@ class ObservatoryStateTest(unittest.TestCase):
         self.assertEqual(self.obs_state_default.telrot_rad, 0.0)
         self.assertEqual(self.obs_state_default.domalt_rad, 1.5)
         self.assertEqual(self.obs_state_default.domaz_rad, 0.0)
-        self.assertListEqual(
-            self.obs_state_default.mountedfilters, ["g", "r", "i", "z", "y"]
+        self.assertTupleEqual(
+            self.obs_state_default.mountedfilters, ("g", "r", "i", "z", "y")
         )
-        self.assertListEqual(self.obs_state_default.unmountedfilters, ["u"])
+        self.assertTupleEqual(self.obs_state_default.unmountedfilters, ("u",))
 
     def test_string_representation(self):
         truth_str = (
@@ -177,13 +214,25 @@ class ObservatoryStateTest(unittest.TestCase):
 
     def test_swap_filter(self):
         self.obs_state_default.swap_filter("u", "z")
-        self.assertListEqual(
+        self.assertTupleEqual(
             self.obs_state_default.mountedfilters, self.mounted_filters_truth
         )
-        self.assertListEqual(
+        self.assertTupleEqual(
             self.obs_state_default.unmountedfilters, self.unmounted_filters_truth
         )
 
+    def test_swap_filter_not_available(self):
+        for filter_to_mount, filter_to_unmount in (("u", "u"), ("g", "z"), ("u", "x")):
+            with self.subTest(mount=filter_to_mount, unmount=filter_to_unmount):
+                with self.assertRaises(ValueError):
+                    self.obs_state_default.swap_filter(
+                        filter_to_mount, filter_to_unmount
+                    )
+                self.assertTupleEqual(
+                    self.obs_state_default.mountedfilters, ("g", "r", "i", "z", "y")
+                )
+                self.assertTupleEqual(self.obs_state_default.unmountedfilters, ("u",))
+
 
 if __name__ == "__main__":
     unittest.main()